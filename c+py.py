@@ -1,24 +1,62 @@
 import sys
 sys.path.append(r"C:\Python Library")
 
-import sys
 import os
-import subprocess
+import asyncio
+import atexit
+import hashlib
+import shutil
+import threading
+import time
 from pathlib import Path
-from PyQt5.QtCore import QEvent
 import logging
 import json
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
-from datetime import datetime
-from dataclasses import dataclass
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from collections import deque
 from enum import Enum
+from functools import lru_cache
+
+# yt-dlp and aiohttp are heavy to import, so they are loaded on first use
+yt_dlp = None
+aiohttp = None
+
+def _get_yt_dlp():
+    """Import yt-dlp on first use; returns None if it is not installed."""
+    global yt_dlp
+    if yt_dlp is None:
+        try:
+            import yt_dlp as _yt_dlp
+        except ImportError:
+            return None
+        yt_dlp = _yt_dlp
+    return yt_dlp
+
+def _get_aiohttp():
+    """Import aiohttp on first use; returns None if it is not installed."""
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as _aiohttp
+        except ImportError:
+            return None
+        aiohttp = _aiohttp
+    return aiohttp
 
 try:
-    import yt_dlp
+    import xxhash
 except ImportError:
-    yt_dlp = None
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ====== APPLICATION CONSTANTS ======
 class Config:
@@ -46,6 +84,9 @@ class Config:
     DOWNLOAD_BUTTON_HEIGHT = 40
     PROGRESS_BAR_HEIGHT = 25
     
+    # Delay after the last keystroke before the URL icon is updated
+    URL_DEBOUNCE_MS = 150
+    
     # Fonts
     TITLE_FONT_SIZE = 12
     LABEL_FONT_SIZE = 11
@@ -56,9 +97,27 @@ class Config:
     GIF_PATH = os.path.join(str(Path.home()), "Downloads", "giphy.gif")
     LOG_FILE = "downloader_errors.log"
 
+    # Network
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+    )
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024  # 256 KiB per read keeps per-chunk overhead low
+    MAX_CONCURRENT_DOWNLOADS = 32  # Connection limit for batch image downloads
+    SMALL_IMAGE_SIZE = 2 * 1024 * 1024  # Bodies below this are read in one go
+    YTDLP_HTTP_CHUNK_SIZE = 10 * 1024 * 1024  # Range size yt-dlp requests per HTTP chunk
+    MAX_FRAGMENT_DOWNLOADS = 16  # Upper bound for parallel HLS/DASH fragments
+    MAX_DOWNLOAD_THREADS = 4  # Pooled worker threads for downloads started from the GUI
+
 # Configure logging
 logging.basicConfig(filename=Config.LOG_FILE, level=logging.ERROR)
 
+# Path separator for joining already-sanitized names onto a base directory
+_SEP = os.sep
+
+# Characters that are not allowed in file or folder names
+_UNSAFE_FN_RE = re.compile(r'[<>:"/\\|?*]')
+
 class Platform(Enum):
     YOUTUBE = "YouTube"
     TIKTOK = "TikTok"
@@ -73,7 +132,9 @@ class DownloadRecord:
     platform: str
     creator: str = ""
     title: str = ""
-    download_date: str = datetime.now().isoformat()
+    download_date: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec='seconds')
+    )
     file_path: str = ""
 
     def to_dict(self):
@@ -90,9 +151,9 @@ class DownloadRecord:
 def organize_by_creator(download_path, creator, platform):
     """Organize downloads by platform/creator (hierarchical)."""
     try:
-        safe_platform = re.sub(r'[<>:"/\\|?*]', '_', platform) if platform else 'Unknown'
-        safe_creator = re.sub(r'[<>:"/\\|?*]', '_', creator) if creator else 'Unknown'
-        target = os.path.join(download_path, safe_platform, safe_creator)
+        safe_platform = _UNSAFE_FN_RE.sub('_', platform) if platform else 'Unknown'
+        safe_creator = _UNSAFE_FN_RE.sub('_', creator) if creator else 'Unknown'
+        target = f"{download_path}{_SEP}{safe_platform}{_SEP}{safe_creator}"
         os.makedirs(target, exist_ok=True)
         return target
     except Exception:
@@ -109,20 +170,62 @@ else:
     SETTINGS_FILE = os.path.join(str(Path.home()), ".yt_downloader_settings.json")
     DOWNLOADS_DIR = os.path.join(str(Path.home()), "YouTubeDownloads")
 
-# Load settings or use defaults
+def _json_dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# In-memory copy of the settings file and the file mtime it was read at
+_settings_cache = None
+_settings_mtime = None
+
+def _settings_file_mtime():
+    try:
+        return os.path.getmtime(SETTINGS_FILE)
+    except OSError:
+        return None
+
+def _read_settings_file():
+    try:
+        with open(SETTINGS_FILE, "rb") as f:
+            return _json_loads(f.read())
+    except Exception:
+        return {}
+
+# Load settings or use defaults; re-read only when the file changed on disk
 def load_settings():
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    global _settings_cache, _settings_mtime
+    mtime = _settings_file_mtime()
+    if _settings_cache is None or mtime != _settings_mtime:
+        _settings_cache = _read_settings_file()
+        _settings_mtime = mtime
+    return _settings_cache
+
+def invalidate_settings():
+    """Drop the cached settings so the next load_settings() re-reads the file."""
+    global _settings_cache
+    _settings_cache = None
 
 def save_settings(settings):
+    global _settings_cache, _settings_mtime
+    _settings_cache = settings
+    tmp_file = SETTINGS_FILE + ".tmp"
     try:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
+        # Write a temp file and swap it in so the settings file is never half-written
+        with open(tmp_file, "wb") as f:
+            f.write(_json_dumps(settings, indent=True))
+        os.replace(tmp_file, SETTINGS_FILE)
+        _settings_mtime = _settings_file_mtime()
     except Exception as e:
         logging.error(f"Failed to save settings: {e}")
 
@@ -131,20 +234,85 @@ current_settings = load_settings()
 OUTPUT_DIR = current_settings.get('output_dir', Config.DEFAULT_OUTPUT_DIR)
 
 # Ensure both directories exist
-if not os.path.exists(DOWNLOADS_DIR):
-    os.makedirs(DOWNLOADS_DIR, exist_ok=True)
+os.makedirs(DOWNLOADS_DIR, exist_ok=True)
 
 # This is the critical fix - ensure OUTPUT_DIR exists!
-if not os.path.exists(OUTPUT_DIR):
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def download_image(url, progress_callback=None):
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Shared HTTP session so repeated image downloads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': Config.USER_AGENT})
+_adapter = HTTPAdapter(
+    pool_connections=30,
+    pool_maxsize=30,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Image MIME subtypes mapped to the extension used for generated filenames
+_CONTENT_TYPE_EXTENSIONS = {
+    'jpeg': 'jpg',
+    'jpg': 'jpg',
+    'pjpeg': 'jpg',
+    'png': 'png',
+    'gif': 'gif',
+    'webp': 'webp',
+}
+
+def _url_hash(url):
+    """Short hash of a URL that stays the same across runs (unlike hash())."""
+    if xxhash is not None:
+        return xxhash.xxh64(url.encode()).hexdigest()[:12]
+    return hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
+
+def _image_filepath(url, headers, claimed_paths=None):
+    """Work out where an image should be saved from its URL and response headers.
+    
+    claimed_paths is the set of paths already taken by the current batch; a clashing
+    name gets the URL hash appended so two downloads never write to the same file.
+    """
+    # Try to get filename from URL or Content-Disposition header
+    filename = None
+    if 'content-disposition' in headers:
+        cd = headers['content-disposition']
+        if 'filename=' in cd:
+            filename = cd.split('filename=')[1].strip('"')
+    
+    if not filename:
+        # Extract filename from URL
+        parsed_url = urlparse(url)
+        filename = os.path.basename(parsed_url.path)
+        if not filename or '.' not in filename:
+            # Generate filename based on content type, e.g. "image/png; charset=..." -> "png"
+            content_type = headers.get('content-type', '')
+            subtype = content_type.split(';')[0].strip().rsplit('/', 1)[-1].lower()
+            ext = _CONTENT_TYPE_EXTENSIONS.get(subtype, 'jpg')
+            filename = f"image_{_url_hash(url)}.{ext}"
+    
+    # Sanitize filename
+    filename = _UNSAFE_FN_RE.sub('_', filename)
+    filepath = f"{OUTPUT_DIR}{_SEP}{filename}"
+    if claimed_paths is not None:
+        if filepath in claimed_paths:
+            root, ext = os.path.splitext(filepath)
+            filepath = f"{root}_{_url_hash(url)}{ext}"
+            suffix = 1
+            while filepath in claimed_paths:
+                # Same URL queued more than once
+                filepath = f"{root}_{_url_hash(url)}_{suffix}{ext}"
+                suffix += 1
+        claimed_paths.add(filepath)
+    return filepath
+
+def download_image(url, progress_callback=None, claimed_paths=None):
     """
     Downloads an image from a direct URL.
     
     Parameters:
         url (str): Direct URL to the image file
         progress_callback (callable, optional): Function to receive progress updates
+        claimed_paths (set, optional): Paths already used by the current batch
     
     Returns:
         str: Path to downloaded file
@@ -154,116 +322,240 @@ def download_image(url, progress_callback=None):
     """
     try:
         # Get the image
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, stream=True)
+        response = _SESSION.get(url, stream=True, timeout=(5, 30))
         response.raise_for_status()
+        # Let urllib3 undo gzip/deflate when reading the raw stream directly
+        response.raw.decode_content = True
         
-        # Try to get filename from URL or Content-Disposition header
-        filename = None
-        if 'content-disposition' in response.headers:
-            cd = response.headers['content-disposition']
-            if 'filename=' in cd:
-                filename = cd.split('filename=')[1].strip('"')
+        filepath = _image_filepath(url, response.headers, claimed_paths)
+        total_size = int(response.headers.get('content-length') or 0)
         
-        if not filename:
-            # Extract filename from URL
-            parsed_url = urlparse(url)
-            filename = os.path.basename(parsed_url.path)
-            if not filename or '.' not in filename:
-                # Generate filename based on content type
-                content_type = response.headers.get('content-type', '')
-                if 'jpeg' in content_type or 'jpg' in content_type:
-                    filename = f"image_{hash(url) % 10000}.jpg"
-                elif 'png' in content_type:
-                    filename = f"image_{hash(url) % 10000}.png"
-                elif 'gif' in content_type:
-                    filename = f"image_{hash(url) % 10000}.gif"
-                elif 'webp' in content_type:
-                    filename = f"image_{hash(url) % 10000}.webp"
-                else:
-                    filename = f"image_{hash(url) % 10000}.jpg"
+        if 0 < total_size < Config.SMALL_IMAGE_SIZE:
+            # Small image: read the whole body at once and write it in one call
+            data = response.content
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            if progress_callback:
+                progress_callback(100)
+            return filepath
         
-        # Sanitize filename
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        filepath = os.path.join(OUTPUT_DIR, filename)
+        if progress_callback is None:
+            # No progress to report, so let shutil run the copy loop
+            with open(filepath, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=Config.DOWNLOAD_CHUNK_SIZE)
+            return filepath
         
         # Download with progress tracking
-        total_size = int(response.headers.get('content-length', 0))
         downloaded = 0
+        last_percent = -1
         
         with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=Config.DOWNLOAD_CHUNK_SIZE):
                 if chunk:
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    if total_size > 0:
+                        percent = min(int((downloaded * 100) / total_size), 100)
+                        # Only emit when the whole-number percentage changes
+                        if percent != last_percent:
+                            last_percent = percent
+                            progress_callback(percent)
+        
+        progress_callback(100)
+            
+        return filepath
+        
+    except Exception as e:
+        raise Exception(f"Failed to download image: {str(e)}")
+
+async def download_image_async(url, session, progress_callback=None, claimed_paths=None):
+    """
+    Downloads an image from a direct URL using a shared aiohttp session.
+    
+    Parameters:
+        url (str): Direct URL to the image file
+        session (aiohttp.ClientSession): Session the request is made on
+        progress_callback (callable, optional): Function to receive progress updates
+        claimed_paths (set, optional): Paths already used by the current batch
+    
+    Returns:
+        str: Path to downloaded file
+    
+    Raises:
+        Exception: If download fails
+    """
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            # No await between choosing and claiming the path, so concurrent tasks can't both take it
+            filepath = _image_filepath(url, response.headers, claimed_paths)
+            
+            total_size = int(response.headers.get('content-length') or 0)
+            downloaded = 0
+            last_percent = -1
+            
+            if 0 < total_size < Config.SMALL_IMAGE_SIZE:
+                # Small image: read the whole body at once and write it in one call
+                data = await response.read()
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+                if progress_callback:
+                    progress_callback(100)
+                return filepath
+            
+            with open(filepath, 'wb') as f:
+                async for chunk in response.content.iter_chunked(Config.DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
                     downloaded += len(chunk)
                     if progress_callback and total_size > 0:
-                        percent = int((downloaded * 100) / total_size)
-                        progress_callback(min(percent, 100))
+                        percent = min(int((downloaded * 100) / total_size), 100)
+                        if percent != last_percent:
+                            last_percent = percent
+                            progress_callback(percent)
         
         if progress_callback:
             progress_callback(100)
-            
-        return filepath
         
+        return filepath
+    
     except Exception as e:
         raise Exception(f"Failed to download image: {str(e)}")
 
-def is_image_url(url):
-    """Check if URL points to an image file"""
-    image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.ico']
-    parsed_url = urlparse(url.lower())
-    path = parsed_url.path
+async def download_many(urls, progress_callback=None):
+    """
+    Downloads several images concurrently over one aiohttp session.
+    
+    Parameters:
+        urls (list[str]): Direct image URLs
+        progress_callback (callable, optional): Receives the overall progress (0-100)
+    
+    Returns:
+        list: Downloaded file path or the raised Exception for each URL, in order
+    """
+    if _get_aiohttp() is None:
+        raise RuntimeError("aiohttp is not installed. Please install it with 'pip install aiohttp'.")
+    
+    percents = [0] * len(urls)
+    last_total = {"value": -1}
+    
+    def make_callback(index):
+        def on_progress(percent):
+            percents[index] = percent
+            total = sum(percents) // len(percents)
+            if total != last_total["value"]:
+                last_total["value"] = total
+                progress_callback(total)
+        return on_progress
+    
+    # The target name depends on response headers, so paths are claimed as each response arrives
+    claimed_paths = set()
+    connector = aiohttp.TCPConnector(limit=Config.MAX_CONCURRENT_DOWNLOADS)
+    headers = {'User-Agent': Config.USER_AGENT}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        return await asyncio.gather(
+            *[
+                download_image_async(u, session, make_callback(i) if progress_callback else None, claimed_paths)
+                for i, u in enumerate(urls)
+            ],
+            return_exceptions=True,
+        )
+
+# URL classification tables (subdomains such as www./m./vm./vt. match by substring)
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.ico')
+_TWIMG_FORMATS = ('format=jpg', 'format=png', 'format=webp')
+_YOUTUBE_DOMAINS = ('youtube.com', 'youtu.be')
+_TIKTOK_DOMAINS = ('tiktok.com',)
+_TWITTER_DOMAINS = ('twitter.com', 'x.com')
+_VIDEO_DOMAINS = _YOUTUBE_DOMAINS + _TIKTOK_DOMAINS
+
+# One alternation so platform detection is a single scan over the URL; the leftmost
+# match wins, so a platform domain takes priority over an image extension in its path
+_URL_CLASSIFY = re.compile(
+    r'(?P<yt>youtube\.com|youtu\.be)'
+    r'|(?P<tt>tiktok\.com)'
+    r'|(?P<tw>twitter\.com|x\.com)'
+    r'|(?P<img>\.(?:jpg|jpeg|png|gif|bmp|webp|svg|ico)(?:[?#]|$))',
+    re.IGNORECASE,
+)
+_GROUP_TO_PLATFORM = {
+    'yt': Platform.YOUTUBE,
+    'tt': Platform.TIKTOK,
+    'tw': Platform.TWITTER,
+    'img': Platform.IMAGE,
+}
+
+# Absolute http(s) URL with a host: scheme and netloc check without urlparse
+_URL_SCHEME_RE = re.compile(r'^(https?)://([^/?#]+)', re.IGNORECASE)
+
+def _is_image(u):
+    """Image check on an already-lowercased URL."""
+    parsed_url = urlparse(u)
     
     # Check for direct image extensions
-    if any(path.endswith(ext) for ext in image_extensions):
+    if parsed_url.path.endswith(_IMAGE_EXTENSIONS):
         return True
     
     # Check for Twitter image URLs with format parameter
-    if 'pbs.twimg.com' in parsed_url.netloc or 'twimg.com' in parsed_url.netloc:
-        if 'format=jpg' in url or 'format=png' in url or 'format=webp' in url:
+    if 'twimg.com' in parsed_url.netloc:
+        if any(fmt in u for fmt in _TWIMG_FORMATS):
             return True
     
     return False
 
+def _is_twitter_status(u):
+    """Twitter/X post check on an already-lowercased URL."""
+    return '/status/' in u and any(domain in u for domain in _TWITTER_DOMAINS)
+
+def _is_video(u):
+    """Video platform check on an already-lowercased URL."""
+    return any(domain in u for domain in _VIDEO_DOMAINS)
+
+@lru_cache(maxsize=128)
+def classify_url(url) -> Platform:
+    """
+    Decide which downloader handles a URL, lowercasing it only once.
+    
+    Checks run in the same order DownloadWorker routes them: direct images,
+    then YouTube/TikTok videos, then Twitter/X posts.
+    
+    Returns:
+        Platform: IMAGE, YOUTUBE, TIKTOK, TWITTER or UNKNOWN if unsupported
+    """
+    u = url.lower()
+    if _is_image(u):
+        return Platform.IMAGE
+    if _is_video(u):
+        return Platform.TIKTOK if any(domain in u for domain in _TIKTOK_DOMAINS) else Platform.YOUTUBE
+    if _is_twitter_status(u):
+        return Platform.TWITTER
+    return Platform.UNKNOWN
+
+def is_image_url(url):
+    """Check if URL points to an image file"""
+    return classify_url(url) is Platform.IMAGE
+
 def is_twitter_media_url(url):
     """Check if URL is a Twitter/X post that might contain media"""
-    twitter_domains = ['twitter.com', 'x.com', 'www.twitter.com', 'mobile.twitter.com']
-    return any(domain in url.lower() for domain in twitter_domains) and '/status/' in url.lower()
+    return _is_twitter_status(url.lower())
 
-def is_tiktok_url(url):  # Keeping the single instance
+def is_tiktok_url(url):
     """Check if URL is a TikTok video URL"""
-    tiktok_domains = ['tiktok.com', 'www.tiktok.com', 'vm.tiktok.com', 'm.tiktok.com']
-    return any(domain in url.lower() for domain in tiktok_domains)
+    u = url.lower()
+    return any(domain in u for domain in _TIKTOK_DOMAINS)
 
 def is_video_url(url):
     """Check if URL is a video platform URL"""
-    video_domains = [
-        'youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com',
-        'tiktok.com', 'www.tiktok.com', 'vm.tiktok.com', 'vt.tiktok.com'
-    ]
-    return any(domain in url.lower() for domain in video_domains)
+    return _is_video(url.lower())
 
 def detect_platform(url: str) -> Platform:
     """Return Platform enum for a given URL string."""
     if not url:
         return Platform.UNKNOWN
-    u = url.lower()
-    if 'youtube.com' in u or 'youtu.be' in u:
-        return Platform.YOUTUBE
-    if 'tiktok.com' in u or 'vt.tiktok.com' in u or 'vm.tiktok.com' in u:
-        return Platform.TIKTOK
-    if 'twitter.com' in u or 'x.com' in u:
-        return Platform.TWITTER
-    if is_image_url(url):
-        return Platform.IMAGE
-    return Platform.UNKNOWN
-
-    """Check if URL is a TikTok video URL"""  # Keeping the single instance
-    tiktok_domains = ['tiktok.com', 'www.tiktok.com', 'vm.tiktok.com', 'vt.tiktok.com']
-    return any(domain in url.lower() for domain in tiktok_domains)  # Keeping the single instance
+    m = _URL_CLASSIFY.search(url)
+    if not m:
+        # Extension-less images such as pbs.twimg.com/...?format=jpg
+        return Platform.IMAGE if is_image_url(url) else Platform.UNKNOWN
+    return _GROUP_TO_PLATFORM[m.lastgroup]
 
 def download_media(url, quality="1080p", progress_callback=None, download_subtitles=False):
     """
@@ -279,14 +571,9 @@ def download_media(url, quality="1080p", progress_callback=None, download_subtit
     Raises:
         Exception when download fails.
     """
-    if yt_dlp is None:
+    if _get_yt_dlp() is None:
         raise RuntimeError("yt-dlp is not installed. Please install it with 'pip install yt-dlp'.")
 
-    user_agent = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
-    )
-
     format_map = {
         "audio": "bestaudio/best",
         "4k": "bestvideo[height<=2160]+bestaudio/best[height<=2160]",
@@ -297,16 +584,7 @@ def download_media(url, quality="1080p", progress_callback=None, download_subtit
         "360p": "bestvideo[height<=360]+bestaudio/best[height<=360]",
     }
     
-    # Determine platform via simple matching
-    lowered = url.lower()
-    if "youtube.com" in lowered or "youtu.be" in lowered:
-        platform = Platform.YOUTUBE.value
-    elif "tiktok.com" in lowered:
-        platform = Platform.TIKTOK.value
-    elif "twitter.com" in lowered or "x.com" in lowered:
-        platform = Platform.TWITTER.value
-    else:
-        platform = Platform.UNKNOWN.value
+    platform = detect_platform(url).value
     
     # For TikTok and Twitter, use best available format as they often have limited options
     is_tiktok = platform == "TikTok"
@@ -343,18 +621,16 @@ def download_media(url, quality="1080p", progress_callback=None, download_subtit
             if hasattr(progress_callback, 'update_speed'):
                 progress_callback.update_speed.emit("")
 
-    # Create organized output directory based on platform and creator
-    temp_output_dir = OUTPUT_DIR  # We'll update this after getting video info
-    
+    # outtmpl is pointed at the platform/creator folder once the video info is known
     ydl_opts = {
-        'outtmpl': os.path.join(temp_output_dir, '%(uploader)s - %(title).150s.%(ext)s'),
+        'outtmpl': os.path.join(OUTPUT_DIR, '%(uploader)s - %(title).150s.%(ext)s'),
         'format': format_str,
         'progress_hooks': [ydl_progress_hook],
         'noplaylist': True,
         'quiet': True,
         'merge_output_format': 'mp4',
         'http_headers': {
-            'User-Agent': user_agent
+            'User-Agent': Config.USER_AGENT
         },
         'concurrent_fragment_downloads': 5,
         'restrictfilenames': True,
@@ -370,33 +646,32 @@ def download_media(url, quality="1080p", progress_callback=None, download_subtit
             'subtitlesformat': 'srt',
         })
     
-    # Ensure output directory exists
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Fetch fragments over more connections (and via aria2c if installed) unless disabled
+    if load_settings().get('parallel_downloads', True):
+        ydl_opts['concurrent_fragment_downloads'] = min(Config.MAX_FRAGMENT_DOWNLOADS, (os.cpu_count() or 1) * 2)
+        ydl_opts['http_chunk_size'] = Config.YTDLP_HTTP_CHUNK_SIZE
+        if shutil.which('aria2c'):
+            ydl_opts['external_downloader'] = {'default': 'aria2c'}
+            ydl_opts['external_downloader_args'] = {'aria2c': ['-x16', '-s16', '-k1M']}
     
-    # Test write permissions
-    try:
-        test_file = os.path.join(OUTPUT_DIR, "test_write.tmp")
-        with open(test_file, 'w') as f:
-            f.write("test")
-        os.remove(test_file)
-    except Exception as e:
-        raise Exception(f"Cannot write to output directory '{OUTPUT_DIR}': {str(e)}")
+    # Ensure output directory exists
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     try:
-        # First, extract video info without downloading
-        with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # First, extract video info without downloading
             info = ydl.extract_info(url, download=False)
             video_info["title"] = info.get('title', 'Unknown Title')
             video_info["uploader"] = info.get('uploader', 'Unknown Creator')
-        
-        # Create organized folder based on creator and platform
-        organized_dir = organize_by_creator(OUTPUT_DIR, video_info["uploader"], platform)
-        ydl_opts['outtmpl'] = os.path.join(organized_dir, '%(uploader)s - %(title).150s.%(ext)s')
-        
-        # Now download with organized path
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
+            
+            # Create organized folder based on creator and platform
+            organized_dir = organize_by_creator(OUTPUT_DIR, video_info["uploader"], platform)
+            ydl.params['outtmpl'] = {
+                'default': os.path.join(organized_dir, '%(uploader)s - %(title).150s.%(ext)s')
+            }
+            
+            # Now download the already-extracted info with the organized path
+            ydl.process_ie_result(info, download=True)
             
         if error_occurred["flag"]:
             raise Exception(f"yt-dlp error: {error_occurred['msg']}")
@@ -415,10 +690,15 @@ def download_media(url, quality="1080p", progress_callback=None, download_subtit
         
         return record
         
+    except PermissionError as e:
+        raise Exception(f"Cannot write to output directory '{OUTPUT_DIR}': {str(e)}")
     except Exception as e:
         # More specific error messages
         error_msg = str(e)
-        if "No such file or directory" in error_msg:
+        if "Permission denied" in error_msg:
+            # yt-dlp wraps file errors in its own DownloadError
+            raise Exception(f"Cannot write to output directory '{OUTPUT_DIR}': {error_msg}")
+        elif "No such file or directory" in error_msg:
             raise Exception("Download failed due to filename/path issues. Please try a different download folder or check permissions.")
         elif "nsig extraction failed" in error_msg:
             raise Exception("YouTube has updated their security. Please update yt-dlp: pip install --upgrade yt-dlp")
@@ -428,89 +708,189 @@ def download_media(url, quality="1080p", progress_callback=None, download_subtit
 # Backwards-compatible alias
 download_youtube = download_media
 
-from PyQt5.QtWidgets import (
-    QApplication, QWidget, QLabel, QLineEdit, QPushButton,
-    QVBoxLayout, QComboBox, QMessageBox, QProgressBar, QHBoxLayout,
-    QSystemTrayIcon, QMenu, QAction, QDialog, QFileDialog,
-    QSpacerItem, QSizePolicy, QCheckBox
-)
-from PyQt5.QtGui import QPalette, QColor, QFont, QPixmap, QIcon, QMovie
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QPoint
-from datetime import datetime
-
-# (Removed duplicate DownloadRecord class - using dataclass at top)
-
-def save_download_history(record):
-    """Save download record to history file"""
-    history_file = os.path.join(str(Path.home()), '.yt_downloader_history.json')
+# Download history is an append-only JSON Lines file (one record per line)
+HISTORY_FILE = os.path.join(str(Path.home()), '.yt_downloader_history.jsonl')
+HISTORY_LIMIT = 100  # Records kept after trimming
+HISTORY_TRIM_AT = 200  # Line count that triggers a trim
+HISTORY_FLUSH_EVERY = 8  # Buffered records that force a flush
+HISTORY_FLUSH_INTERVAL = 5  # Seconds since the last flush that force a flush
+
+_history = None  # deque of the newest HISTORY_LIMIT records, loaded on first use
+_history_line_count = 0
+_history_buffer = []
+_history_lock = threading.Lock()
+_last_history_flush = time.monotonic()
+
+def _ensure_history_loaded():
+    """Read the newest records into _history once. Caller must hold _history_lock."""
+    global _history, _history_line_count
+    if _history is not None:
+        return
+    _history = deque(maxlen=HISTORY_LIMIT)
+    tail = deque(maxlen=HISTORY_LIMIT)
+    line_count = 0
+    try:
+        with open(HISTORY_FILE, 'rb') as f:
+            for line in f:
+                line_count += 1
+                tail.append(line)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.error(f"Failed to load download history: {e}")
     
-    # Load existing history
-    history = []
-    if os.path.exists(history_file):
+    for line in tail:
         try:
-            with open(history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-        except Exception:
-            history = []
-    
-    # Add new record
-    history.append(record.to_dict())
-    
-    # Keep only last 100 downloads
-    history = history[-100:]
+            _history.append(_json_loads(line))
+        except ValueError:
+            continue  # Skip a partially written line
+    _history_line_count = line_count
+
+def trim_history_if_needed():
+    """Rewrite the history file from the in-memory records once it grows too long.
     
-    # Save back
+    Caller must hold _history_lock and have flushed the buffer.
+    """
+    global _history_line_count
+    if _history_line_count <= HISTORY_TRIM_AT:
+        return
     try:
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+        with open(HISTORY_FILE, 'wb') as f:
+            f.write(b''.join(_json_dumps(r) + b'\n' for r in _history))
+        _history_line_count = len(_history)
     except Exception as e:
-        logging.error(f"Failed to save download history: {e}")
+        logging.error(f"Failed to trim download history: {e}")
+
+def _flush_history():
+    """Append every buffered history record to the history file in one write."""
+    global _history_line_count, _last_history_flush
+    with _history_lock:
+        _last_history_flush = time.monotonic()
+        if not _history_buffer:
+            return
+        records = list(_history_buffer)
+        _history_buffer.clear()
+        try:
+            with open(HISTORY_FILE, 'ab') as f:
+                f.write(b''.join(_json_dumps(r) + b'\n' for r in records))
+        except Exception as e:
+            logging.error(f"Failed to save download history: {e}")
+            return
+        
+        _history_line_count += len(records)
+        trim_history_if_needed()
 
-# (Removed second organize_by_creator - unified above)
+# Don't lose buffered records on shutdown
+atexit.register(_flush_history)
 
-class DownloadWorker(QThread):
+def save_download_history(record):
+    """Queue download record for the history file, flushing in batches"""
+    with _history_lock:
+        _ensure_history_loaded()
+        entry = record.to_dict()
+        _history.append(entry)
+        _history_buffer.append(entry)
+        flush_due = (
+            len(_history_buffer) >= HISTORY_FLUSH_EVERY
+            or time.monotonic() - _last_history_flush > HISTORY_FLUSH_INTERVAL
+        )
+    if flush_due:
+        _flush_history()
+
+def load_history():
+    """Return the most recent download records (oldest first) as dicts."""
+    with _history_lock:
+        _ensure_history_loaded()
+        return list(_history)
+
+# ====== GUI ======
+# Everything above works without Qt; the widgets below need PyQt5
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QLabel, QLineEdit, QPushButton,
+    QVBoxLayout, QComboBox, QMessageBox, QProgressBar, QHBoxLayout,
+    QSystemTrayIcon, QMenu, QAction, QDialog, QFileDialog, QCheckBox
+)
+from PyQt5.QtGui import QPalette, QColor, QFont, QPixmap, QPixmapCache, QMovie, QImageReader
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QPoint, QEvent, QTimer, QProcess
+
+class DownloadSignals(QObject):
+    """Signals for DownloadWorker; a QRunnable is not a QObject and cannot declare its own."""
     progress = pyqtSignal(int)
     finished = pyqtSignal(bool, str)
     update_speed = pyqtSignal(str)
 
+class DownloadWorker(QRunnable):
     def __init__(self, url, quality, download_subtitles=False):
         super().__init__()
-        self.url = url
+        self.signals = DownloadSignals()
+        # A list of URLs is queued as one batch of direct image downloads
+        self.urls = list(url) if isinstance(url, (list, tuple)) else [url]
+        self.url = self.urls[0]
         self.quality = quality
         self.download_subtitles = download_subtitles
 
+    def run_image_batch(self, progress_callback):
+        """Download every queued image URL, concurrently when aiohttp is available."""
+        if _get_aiohttp() is not None:
+            results = asyncio.run(download_many(self.urls, progress_callback))
+        else:
+            results = []
+            claimed_paths = set()
+            for index, url in enumerate(self.urls):
+                try:
+                    results.append(download_image(url, claimed_paths=claimed_paths))
+                except Exception as e:
+                    results.append(e)
+                progress_callback(int((index + 1) * 100 / len(self.urls)))
+        
+        failures = [r for r in results if isinstance(r, Exception)]
+        for failure in failures:
+            logging.error(str(failure))
+        # Count distinct files actually written
+        downloaded = len({r for r in results if not isinstance(r, Exception)})
+        if failures and not downloaded:
+            self.signals.finished.emit(False, f"❌ Error: {failures[0]}")
+        elif failures:
+            self.signals.finished.emit(True, f"✅ {downloaded} of {len(results)} images downloaded ({len(failures)} failed)")
+        else:
+            self.signals.finished.emit(True, f"✅ {downloaded} images downloaded")
+
     def run(self):
         try:
             def progress_callback(percent):
                 if 0 <= percent <= 100:
-                    self.progress.emit(percent)
-            progress_callback.update_speed = self.update_speed  # Attach signal
+                    self.signals.progress.emit(percent)
+            progress_callback.update_speed = self.signals.update_speed  # Attach signal
             
             # Enhanced URL validation and routing
-            if is_image_url(self.url):
+            platform = classify_url(self.url)
+            if len(self.urls) > 1:
+                # Several direct image URLs queued at once
+                self.run_image_batch(progress_callback)
+            elif platform is Platform.IMAGE:
                 # Direct image download
                 downloaded_path = download_image(self.url, progress_callback)
-                self.finished.emit(True, f"✅ Image downloaded: {os.path.basename(downloaded_path)}")
-            elif is_video_url(self.url):
+                self.signals.finished.emit(True, f"✅ Image downloaded: {os.path.basename(downloaded_path)}")
+            elif platform in (Platform.YOUTUBE, Platform.TIKTOK):
                 # Video download via yt-dlp (YouTube, TikTok, etc.)
                 record = download_youtube(self.url, self.quality, progress_callback, self.download_subtitles)
                 platform_name = record.platform if record else "Video"
                 creator_name = f" by {record.creator}" if record and record.creator else ""
-                self.finished.emit(True, f"✅ {platform_name} download completed{creator_name}")
-            elif is_twitter_media_url(self.url):
+                self.signals.finished.emit(True, f"✅ {platform_name} download completed{creator_name}")
+            elif platform is Platform.TWITTER:
                 # Try Twitter/X media download with fallback handling
                 try:
                     record = download_youtube(self.url, self.quality, progress_callback, self.download_subtitles)
                     creator_name = f" by {record.creator}" if record and record.creator else ""
-                    self.finished.emit(True, f"✅ Twitter media download completed{creator_name}")
+                    self.signals.finished.emit(True, f"✅ Twitter media download completed{creator_name}")
                 except Exception as twitter_error:
                     error_msg = str(twitter_error).lower()
                     if "not a video" in error_msg or "media #1 is not a video" in error_msg:
-                        self.finished.emit(False, "❌ This Twitter post contains images, not videos. Twitter image downloads are not supported yet.")
+                        self.signals.finished.emit(False, "❌ This Twitter post contains images, not videos. Twitter image downloads are not supported yet.")
                     elif "private" in error_msg or "protected" in error_msg:
-                        self.finished.emit(False, "❌ Cannot download from private/protected Twitter accounts.")
+                        self.signals.finished.emit(False, "❌ Cannot download from private/protected Twitter accounts.")
                     elif "not found" in error_msg or "does not exist" in error_msg:
-                        self.finished.emit(False, "❌ Twitter post not found or has been deleted.")
+                        self.signals.finished.emit(False, "❌ Twitter post not found or has been deleted.")
                     else:
                         raise twitter_error  # Re-raise if it's a different error
             else:
@@ -518,14 +898,58 @@ class DownloadWorker(QThread):
                 
         except Exception as e:
             logging.error(str(e), exc_info=True)
-            self.finished.emit(False, f"❌ Error: {str(e)}")
+            self.signals.finished.emit(False, f"❌ Error: {str(e)}")
+
+def _basename_if_exists(path):
+    """File name of path if it exists on disk, else ''."""
+    if path and os.path.exists(path):
+        return os.path.basename(path)
+    return ''
+
+# Image formats whose Qt decoder can produce a downscaled image without decoding full size
+_SCALED_DECODE_FORMATS = (b'jpeg', b'jpg', b'svg', b'svgz')
+
+def _scaled_pixmap(path, size):
+    """Return path scaled to size via the app-wide QPixmapCache, or None if it can't be loaded.
+
+    The key includes the file's mtime, so replacing an icon on disk picks up the new image.
+    """
+    try:
+        key = f"{path}:{os.path.getmtime(path)}:{size.width()}x{size.height()}"
+    except OSError:
+        return None
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        reader = QImageReader(path)
+        source_size = reader.size()
+        if bytes(reader.format()).lower() in _SCALED_DECODE_FORMATS and source_size.isValid():
+            # These decoders render straight at the requested size (aspect ratio kept)
+            reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                return None
+            pixmap = QPixmap.fromImage(image)
+        else:
+            # Other formats decode full size anyway (and Qt would smooth-scale them);
+            # nearest-neighbour is plenty at 32px
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                return None
+            pixmap = pixmap.scaled(size, Qt.KeepAspectRatio, Qt.FastTransformation)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_app = parent
         self.setWindowTitle("Settings")
-        self.setFixedSize(500, 640)
+        self.setFixedSize(500, 670)
+        self._populated = False
+        self._build_skeleton()
+
+    def _build_skeleton(self):
+        """Create the widgets and layout; current values are filled in on first show."""
         layout = QVBoxLayout()
 
         # Apply dark/gray background so text is readable
@@ -553,7 +977,7 @@ class SettingsDialog(QDialog):
         """)
         
         # Current folder display
-        self.current_folder_label = QLabel(f"Current: {OUTPUT_DIR}")
+        self.current_folder_label = QLabel()
         self.current_folder_label.setWordWrap(True)
         self.current_folder_label.setStyleSheet("color: #DDDDDD; padding: 5px;")
         layout.addWidget(self.current_folder_label)
@@ -570,12 +994,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(gif_label)
         
         # Current GIF display
-        current_settings = load_settings()
-        custom_gif_path = current_settings.get('custom_gif_path', '')
-        if custom_gif_path and os.path.exists(custom_gif_path):
-            self.current_gif_label = QLabel(f"Current: {os.path.basename(custom_gif_path)}")
-        else:
-            self.current_gif_label = QLabel("Current: Default emoji fallback")
+        self.current_gif_label = QLabel()
         self.current_gif_label.setWordWrap(True)
         self.current_gif_label.setStyleSheet("color: #DDDDDD; padding: 5px;")
         layout.addWidget(self.current_gif_label)
@@ -596,11 +1015,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(icon_label)
         
         # Current icon display
-        custom_icon_path = current_settings.get('custom_icon_path', '')
-        if custom_icon_path and os.path.exists(custom_icon_path):
-            self.current_icon_label = QLabel(f"Current: {os.path.basename(custom_icon_path)}")
-        else:
-            self.current_icon_label = QLabel("Current: Default TV emoji (📺)")
+        self.current_icon_label = QLabel()
         self.current_icon_label.setWordWrap(True)
         self.current_icon_label.setStyleSheet("color: #DDDDDD; padding: 5px;")
         layout.addWidget(self.current_icon_label)
@@ -620,32 +1035,30 @@ class SettingsDialog(QDialog):
         per_platform_label.setStyleSheet("color: #DDDDDD; font-weight: bold;")
         layout.addWidget(per_platform_label)
 
-        current_settings = load_settings()
-        youtube_path = current_settings.get('youtube_icon_path', '')
-        tiktok_path = current_settings.get('tiktok_icon_path', '')
-        twitter_path = current_settings.get('twitter_icon_path', '')
+        # Status labels per platform key, filled in by _populate_current_values
+        self.platform_status_labels = {}
 
-        def platform_row(label_text, key, existing_path):
+        def platform_row(label_text, key):
             row = QHBoxLayout()
             lbl = QLabel(label_text)
             lbl.setStyleSheet("color:#DDDDDD")
             row.addWidget(lbl)
-            status = QLabel(os.path.basename(existing_path) if existing_path and os.path.exists(existing_path) else "Default")
+            status = QLabel()
             status.setStyleSheet("color:#AAAAAA")
             row.addWidget(status)
+            self.platform_status_labels[key] = status
             choose_btn = QPushButton("Choose")
             def choose():
                 fp, _ = QFileDialog.getOpenFileName(self, f"Select {label_text} Icon", "", "Image Files (*.png *.jpg *.jpeg *.bmp *.gif *.ico);;All Files (*)")
                 if fp:
-                    pm = QPixmap(fp)
-                    if pm.isNull():
+                    # canRead() only inspects the header instead of decoding the image
+                    if not QImageReader(fp).canRead():
                         QMessageBox.warning(self, "Invalid", "Not a valid image file.")
                         return
                     st = load_settings(); st[f'{key}_icon_path'] = fp; save_settings(st)
                     status.setText(os.path.basename(fp))
                     if self.parent_app:
-                        self.parent_app.reload_icon_settings()
-                        self.parent_app.refresh_dynamic_icon()
+                        self.parent_app.refresh_all()
             choose_btn.clicked.connect(choose)
             row.addWidget(choose_btn)
             reset_btn = QPushButton("Reset")
@@ -653,23 +1066,25 @@ class SettingsDialog(QDialog):
                 st = load_settings(); st.pop(f'{key}_icon_path', None); save_settings(st)
                 status.setText("Default")
                 if self.parent_app:
-                    self.parent_app.reload_icon_settings()
-                    self.parent_app.refresh_dynamic_icon()
+                    self.parent_app.refresh_all()
             reset_btn.clicked.connect(reset)
             row.addWidget(reset_btn)
             layout.addLayout(row)
-        platform_row("YouTube", "youtube", youtube_path)
-        platform_row("TikTok", "tiktok", tiktok_path)
-        platform_row("Twitter", "twitter", twitter_path)
+        platform_row("YouTube", "youtube")
+        platform_row("TikTok", "tiktok")
+        platform_row("Twitter", "twitter")
 
         layout.addSpacing(10)
 
         # Dynamic platform icon toggle
-        current_settings = load_settings()
         self.dynamic_icons_checkbox = QCheckBox("Enable Dynamic Platform Icons (use per-platform icons if set)")
-        self.dynamic_icons_checkbox.setChecked(current_settings.get('dynamic_icons_enabled', True))
         self.dynamic_icons_checkbox.setStyleSheet("color: #DDDDDD;")
         layout.addWidget(self.dynamic_icons_checkbox)
+
+        # Parallel download toggle
+        self.parallel_downloads_checkbox = QCheckBox("Enable Parallel Downloads (more connections; uses aria2c if installed)")
+        self.parallel_downloads_checkbox.setStyleSheet("color: #DDDDDD;")
+        layout.addWidget(self.parallel_downloads_checkbox)
         
         # Save button
         self.save_btn = QPushButton("Save Settings")
@@ -678,6 +1093,29 @@ class SettingsDialog(QDialog):
         
         self.setLayout(layout)
 
+    def _populate_current_values(self):
+        """Fill the widgets from the saved settings."""
+        current_settings = load_settings()
+        self.current_folder_label.setText(f"Current: {OUTPUT_DIR}")
+
+        gif_name = _basename_if_exists(current_settings.get('custom_gif_path', ''))
+        self.current_gif_label.setText(f"Current: {gif_name}" if gif_name else "Current: Default emoji fallback")
+
+        icon_name = _basename_if_exists(current_settings.get('custom_icon_path', ''))
+        self.current_icon_label.setText(f"Current: {icon_name}" if icon_name else "Current: Default TV emoji (📺)")
+
+        for key, status in self.platform_status_labels.items():
+            status.setText(_basename_if_exists(current_settings.get(f'{key}_icon_path', '')) or "Default")
+
+        self.dynamic_icons_checkbox.setChecked(current_settings.get('dynamic_icons_enabled', True))
+        self.parallel_downloads_checkbox.setChecked(current_settings.get('parallel_downloads', True))
+
+    def showEvent(self, event):
+        if not self._populated:
+            self._populate_current_values()
+            self._populated = True
+        super().showEvent(event)
+
     def change_gif(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, 
@@ -734,9 +1172,8 @@ class SettingsDialog(QDialog):
         )
         if file_path:
             try:
-                # Test if the image can be loaded
-                test_pixmap = QPixmap(file_path)
-                if test_pixmap.isNull():
+                # Test if the image can be loaded (header check, no full decode)
+                if not QImageReader(file_path).canRead():
                     QMessageBox.warning(self, "Invalid File", "Selected file is not a valid image.")
                     return
                 
@@ -768,9 +1205,7 @@ class SettingsDialog(QDialog):
         
         # Reset main window icon if parent exists
         if self.parent_app:
-            self.parent_app.reset_to_default_icon()
-            self.parent_app.reload_icon_settings()
-            self.parent_app.refresh_dynamic_icon()
+            self.parent_app.refresh_all(reset=True)
         
         QMessageBox.information(self, "Reset", "Icon reset to default!")
 
@@ -783,57 +1218,141 @@ class SettingsDialog(QDialog):
             # Create directory if it doesn't exist
             try:
                 os.makedirs(OUTPUT_DIR, exist_ok=True)
-                # Test write permission
-                test_file = os.path.join(OUTPUT_DIR, "test_write.tmp")
-                with open(test_file, 'w') as f:
-                    f.write("test")
-                os.remove(test_file)
             except Exception as e:
                 QMessageBox.warning(self, "Warning", f"Cannot write to folder: {str(e)}")
                 return
+            # Cheap permission check; ACL cases it misses surface as PermissionError in download_media
+            if not os.access(OUTPUT_DIR, os.W_OK):
+                QMessageBox.warning(self, "Warning", f"Cannot write to folder: {OUTPUT_DIR}")
+                return
     
     def save_and_close(self):
         # Save current settings
         settings = load_settings()
         settings['output_dir'] = OUTPUT_DIR
         settings['dynamic_icons_enabled'] = self.dynamic_icons_checkbox.isChecked()
+        settings['parallel_downloads'] = self.parallel_downloads_checkbox.isChecked()
         save_settings(settings)
         if self.parent_app:
-            self.parent_app.reload_icon_settings()
-            self.parent_app.refresh_dynamic_icon()
+            self.parent_app.refresh_all()
         self.accept()
 
-    def load_custom_gif(self, gif_path):
-        """Load a custom GIF and automatically resize it to fit the current size"""
-        try:
-            if os.path.exists(gif_path):
-                # Stop current movie if any
-                if hasattr(self, 'gif_movie') and self.gif_movie:
-                    self.gif_movie.stop()
-                
-                # Load new GIF
-                self.gif_movie = QMovie(gif_path)
-                if self.gif_movie.isValid():
-                    # Automatically scale to the current GIF label size
-                    self.gif_movie.setScaledSize(self.gif_label.size())
-                    self.gif_label.setMovie(self.gif_movie)
-                    self.gif_movie.start()
-                    return True
-        except Exception as e:
-            logging.error(f"Failed to load custom GIF: {e}")
-        return False
+# Stylesheets interpolated from Config once at import instead of per widget creation
+def _outlined_button_ss(name, color):
+    return f"""
+            QPushButton#{name} {{
+                background-color: {Config.OLED_BLACK};
+                color: {color};
+                border-radius: 8px;
+                font-weight: bold;
+                border: 1px solid {color};
+                margin: 3px;
+            }}
+            QPushButton#{name}:hover {{
+                background-color: #111111;
+                border: 2px solid {color};
+            }}
+            QPushButton#{name}:pressed {{
+                background-color: #222222;
+                border: 1px solid {color};
+            }}
+        """
 
-    def reset_to_default_gif(self):
-        """Reset GIF to default emoji"""
-        if hasattr(self, 'gif_movie') and self.gif_movie:
-            self.gif_movie.stop()
-        
-        # Reset to emoji fallback
-        self.gif_label.setMovie(None)
-        self.gif_label.setText("🎬")
-        self.gif_label.setStyleSheet(f"color: {Config.NEON_GREEN}; font-size: 32px; background: transparent;")
+# Main window stylesheet, applied once on DownloaderApp. Every rule is scoped to an
+# objectName so it does not leak into SettingsDialog or message boxes parented to the window.
+APP_SS = """
+            QWidget#titleBar {
+                background-color: #000000;
+                border-bottom: 1px solid #333333;
+            }
+            QLabel#titleLabel, QLabel#sectionLabel {
+                color: #FFFFFF;
+            }
+            QPushButton#titleBarButton {
+                background-color: #000000;
+                color: #DDDDDD;
+                border: none;
+            }
+            QLineEdit#urlInput, QComboBox#qualityCombo {
+                border-radius: 6px;
+                padding: 5px;
+                background-color: #000000;
+                color: #DDDDDD;
+            }
+            QCheckBox#subtitleCheckbox {
+                color: #FFFFFF;
+            }
+            QCheckBox#subtitleCheckbox::indicator:checked {
+                background-color: #39FF14;   /* Neon green when checked */
+                border: 2px solid #39FF14;
+            }
+            QCheckBox#subtitleCheckbox::indicator {
+                width: 18px;
+                height: 18px;
+                border-radius: 4px;
+                border: 2px solid #39FF14;
+            }
+            QPushButton#downloadBtn {
+                background-color: #000000;   /* OLED black */
+                color: #39FF14;              /* Neon green text */
+                font-weight: bold;
+                border-radius: 8px;
+                border: 1px solid #39FF14;   /* Subtle neon border */
+            }
+            QPushButton#downloadBtn:hover {
+                background-color: #111111;
+                border: 2px solid #39FF14;   /* Thicker border on hover */
+            }
+            QPushButton#downloadBtn:pressed {
+                background-color: #222222;
+                border: 1px solid #39FF14;
+            }
+            QLabel#progressLabel {
+                color: #39FF14;
+            }
+            QProgressBar#progressBar {
+                border: 1px solid #39FF14;
+                border-radius: 12px;
+                background-color: #000000;
+                color: #39FF14;
+                text-align: center;
+                font-weight: bold;
+            }
+            QProgressBar#progressBar::chunk {
+                background-color: #39FF14;
+                border-radius: 10px;
+                margin: 1px;
+            }
+            QLabel#speedLabel {
+                color: #39FF14;
+                font-size: 10pt;
+            }
+        """ + _outlined_button_ss("openFolderBtn", Config.BRIGHT_YELLOW) \
+            + _outlined_button_ss("settingsBtn", Config.LIGHT_GRAY) \
+            + _outlined_button_ss("pinBtn", Config.LIGHT_GRAY) + f"""
+            QPushButton#pinBtn:checked {{
+                background-color: #333333;
+                border: 2px solid {Config.NEON_GREEN};
+                color: {Config.NEON_GREEN};
+            }}
+        """
+GIF_FALLBACK_SS = f"color: {Config.NEON_GREEN}; font-size: 32px; background: transparent;"
+STATUS_BUSY_SS = f"color: {Config.LIGHT_GRAY}; background-color: {Config.OLED_BLACK}; border-radius:6px;"
 
 class DownloaderApp(QWidget):
+    # Default GIF location, probed once per process (None = not probed yet)
+    _resolved_gif_path = None
+    # Theme palettes, built by the first instance and shared afterwards
+    _PALETTE_DARK = None
+    _PALETTE_LIGHT = None
+    # Emoji and stylesheet shown for a platform that has no custom icon
+    _PLATFORM_FALLBACK = {
+        Platform.YOUTUBE: ("📺", f"color: {Config.YOUTUBE_RED}; font-size: 20px; background: transparent;"),
+        Platform.TIKTOK: ("🎵", "color: #FFFFFF; font-size: 20px; background: transparent;"),
+        Platform.TWITTER: ("🐦", "color: #1DA1F2; font-size: 20px; background: transparent;"),
+        Platform.IMAGE: ("🖼️", "color: #DDDDDD; font-size: 20px; background: transparent;"),
+    }
+
     def __init__(self):
         super().__init__()
         # Frameless window for fully custom black title area
@@ -845,12 +1364,17 @@ class DownloaderApp(QWidget):
         # Load icon-related settings BEFORE building UI so load_url_icon has attributes
         self.reload_icon_settings()
         self.init_ui()
+        self._build_palettes()
         self.apply_oled_black_theme()
         # Enable drag-and-drop for the URL input
         self.url_input.setAcceptDrops(True)
         self.url_input.installEventFilter(self)
 
-        # Dynamic icon update on URL change
+        # Dynamic icon update on URL change, once typing/pasting pauses
+        self._url_debounce = QTimer(self)
+        self._url_debounce.setSingleShot(True)
+        self._url_debounce.setInterval(Config.URL_DEBOUNCE_MS)
+        self._url_debounce.timeout.connect(self._do_url_changed)
         self.url_input.textChanged.connect(self.on_url_changed)
 
         # System tray icon
@@ -864,8 +1388,11 @@ class DownloaderApp(QWidget):
         tray_menu.addAction(quit_action)
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.show()
+        # The "minimized to tray" notice is only shown the first time the window is closed
+        self._tray_notified = False
 
-        self.workers = []
+        # Downloads run on pooled threads instead of one new QThread each
+        QThreadPool.globalInstance().setMaxThreadCount(Config.MAX_DOWNLOAD_THREADS)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -874,27 +1401,27 @@ class DownloaderApp(QWidget):
 
         # --- Custom black title bar ---
         title_bar = QWidget()
+        title_bar.setObjectName("titleBar")
         title_bar.setFixedHeight(32)
-        title_bar.setStyleSheet("background-color: #000000; border-bottom: 1px solid #333333;")
         tb_layout = QHBoxLayout(title_bar)
         tb_layout.setContentsMargins(8, 0, 8, 0)
         tb_layout.setSpacing(6)
 
         title_label = QLabel("Media Downloader")
         title_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        title_label.setStyleSheet("color: #FFFFFF;")
+        title_label.setObjectName("titleLabel")
         tb_layout.addWidget(title_label)
         tb_layout.addStretch(1)
 
         min_btn = QPushButton("-")
+        min_btn.setObjectName("titleBarButton")
         min_btn.setFixedSize(24, 24)
-        min_btn.setStyleSheet("background-color:#000000;color:#DDDDDD;border:none;")
         min_btn.clicked.connect(self.showMinimized)
         tb_layout.addWidget(min_btn)
 
         close_btn = QPushButton("✕")
+        close_btn.setObjectName("titleBarButton")
         close_btn.setFixedSize(24, 24)
-        close_btn.setStyleSheet("background-color:#000000;color:#DDDDDD;border:none;")
         close_btn.clicked.connect(QApplication.instance().quit)
         tb_layout.addWidget(close_btn)
 
@@ -906,12 +1433,10 @@ class DownloaderApp(QWidget):
         content_layout.setContentsMargins(30, 8, 30, 40)
         content_layout.setSpacing(6)
 
-        self.setFixedSize(Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
-
         # Video URL Label
         url_label = QLabel("Media URL")
         url_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        url_label.setStyleSheet("color: #FFFFFF;")
+        url_label.setObjectName("sectionLabel")
         content_layout.addWidget(url_label)
         content_layout.addSpacing(6)
 
@@ -920,8 +1445,8 @@ class DownloaderApp(QWidget):
         self.play_icon = QLabel()
         self.play_icon.setFixedSize(32, 32)
         # Prefer YouTube per-platform icon as the default if configured
-        yt_default_path = self.platform_icon_paths.get(Platform.YOUTUBE, '')
-        if yt_default_path and os.path.exists(yt_default_path) and self.load_custom_icon(yt_default_path):
+        yt_default_path = self._resolved_platform_icons.get(Platform.YOUTUBE)
+        if yt_default_path and self.load_custom_icon(yt_default_path):
             pass
         else:
             self.play_icon.setText("📺")
@@ -930,7 +1455,7 @@ class DownloaderApp(QWidget):
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("Enter YouTube video, Twitter/X post, or direct image URL")
         self.url_input.setMinimumHeight(36)
-        self.url_input.setStyleSheet("border-radius: 6px; padding: 5px; background-color: #000000; color: #DDDDDD;")
+        self.url_input.setObjectName("urlInput")
         url_row.addWidget(self.url_input, alignment=Qt.AlignVCenter)
         content_layout.addLayout(url_row)
         # Slightly less space before "Video Quality" title
@@ -939,7 +1464,7 @@ class DownloaderApp(QWidget):
         # Video Quality Label
         quality_label = QLabel("Video Quality")
         quality_label.setFont(QFont("Segoe UI", 11, QFont.Bold))  # Match font and size
-        quality_label.setStyleSheet("color: #FFFFFF;")            # Match color
+        quality_label.setObjectName("sectionLabel")
         content_layout.addWidget(quality_label)
         content_layout.addSpacing(6)
 
@@ -948,28 +1473,14 @@ class DownloaderApp(QWidget):
         self.quality_combo = QComboBox()
         self.quality_combo.addItems(["4k", "2k", "1080p", "720p", "480p", "360p", "best", "audio"])
         self.quality_combo.setMinimumHeight(30)
-        self.quality_combo.setStyleSheet("border-radius: 6px; padding: 5px; background-color: #000000; color: #DDDDDD;")
+        self.quality_combo.setObjectName("qualityCombo")
         quality_row.addWidget(self.quality_combo)
         content_layout.addLayout(quality_row)
         content_layout.addSpacing(20)
 
         # Download Subtitles Checkbox
         self.subtitle_checkbox = QCheckBox("Download Subtitles (YouTube only)")
-        self.subtitle_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #FFFFFF;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #39FF14;   /* Neon green when checked */
-                border: 2px solid #39FF14;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid #39FF14;
-            }
-        """)
+        self.subtitle_checkbox.setObjectName("subtitleCheckbox")
         content_layout.addWidget(self.subtitle_checkbox)
         content_layout.addSpacing(20)
 
@@ -978,51 +1489,21 @@ class DownloaderApp(QWidget):
         self.download_btn.setMinimumHeight(40)
         self.download_btn.clicked.connect(self.start_download)
         self.download_btn.setCursor(Qt.PointingHandCursor)
-        self.download_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #000000;   /* OLED black */
-                color: #39FF14;              /* Neon green text */
-                font-weight: bold;
-                border-radius: 8px;
-                border: 1px solid #39FF14;   /* Subtle neon border */
-            }
-            QPushButton:hover {
-                background-color: #111111;
-                border: 2px solid #39FF14;   /* Thicker border on hover */
-            }
-            QPushButton:pressed {
-                background-color: #222222;
-                border: 1px solid #39FF14;
-            }
-        """)
+        self.download_btn.setObjectName("downloadBtn")
         content_layout.addWidget(self.download_btn)
         content_layout.addSpacing(16)
 
         # Download Progress Label (Neon Green)
         progress_label = QLabel("Download Progress")
         progress_label.setFont(QFont("Segoe UI", 10, QFont.Bold))  # Reduced from 11 to 10
-        progress_label.setStyleSheet("color: #39FF14;")  # Neon green
+        progress_label.setObjectName("progressLabel")
         progress_label.setAlignment(Qt.AlignCenter)
         content_layout.addWidget(progress_label)
 
         # Progress Bar
         self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("progressBar")
         self.progress_bar.setFixedHeight(25)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #39FF14;
-                border-radius: 12px;
-                background-color: #000000;
-                color: #39FF14;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #39FF14;
-                border-radius: 10px;
-                margin: 1px;
-            }
-        """)
         self.progress_bar.setValue(0)
         content_layout.addWidget(self.progress_bar)
 
@@ -1042,13 +1523,14 @@ class DownloaderApp(QWidget):
         # Speed and ETA Label
         self.speed_label = QLabel("")
         self.speed_label.setAlignment(Qt.AlignCenter)
-        self.speed_label.setStyleSheet("color: #39FF14; font-size: 10pt;")
+        self.speed_label.setObjectName("speedLabel")
         content_layout.addWidget(self.speed_label)
 
         # Status Label
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setFixedHeight(30)
+        # Set on the widget, not in APP_SS: the runtime status styles replace it wholesale
         self.status_label.setStyleSheet("""
             QLabel {
                 background-color: #000000;
@@ -1064,48 +1546,14 @@ class DownloaderApp(QWidget):
         self.open_folder_btn = QPushButton("📂 Open Folder")
         self.open_folder_btn.setMinimumHeight(30)
         self.open_folder_btn.clicked.connect(self.open_download_folder)
-        self.open_folder_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Config.OLED_BLACK};
-                color: #FFEB3B;
-                border-radius: 8px;
-                font-weight: bold;
-                border: 1px solid #FFEB3B;
-                margin: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: #111111;
-                border: 2px solid #FFEB3B;
-            }}
-            QPushButton:pressed {{
-                background-color: #222222;
-                border: 1px solid #FFEB3B;
-            }}
-        """)
+        self.open_folder_btn.setObjectName("openFolderBtn")
         content_layout.addWidget(self.open_folder_btn)
 
         # Settings Button
         self.settings_btn = QPushButton("⚙️ Settings")
         self.settings_btn.setMinimumHeight(30)
         self.settings_btn.clicked.connect(self.open_settings)
-        self.settings_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Config.OLED_BLACK};
-                color: #DDDDDD;
-                border-radius: 8px;
-                font-weight: bold;
-                border: 1px solid #DDDDDD;
-                margin: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: #111111;
-                border: 2px solid #DDDDDD;
-            }}
-            QPushButton:pressed {{
-                background-color: #222222;
-                border: 1px solid #DDDDDD;
-            }}
-        """)
+        self.settings_btn.setObjectName("settingsBtn")
         content_layout.addWidget(self.settings_btn)
 
         # Pin Button
@@ -1113,34 +1561,13 @@ class DownloaderApp(QWidget):
         self.pin_btn.setCheckable(True)
         self.pin_btn.setMinimumHeight(30)
         self.pin_btn.clicked.connect(self.toggle_pin)
-        self.pin_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Config.OLED_BLACK};
-                color: #DDDDDD;
-                border-radius: 8px;
-                font-weight: bold;
-                border: 1px solid #DDDDDD;
-                margin: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: #111111;
-                border: 2px solid #DDDDDD;
-            }}
-            QPushButton:pressed {{
-                background-color: #222222;
-                border: 1px solid #DDDDDD;
-            }}
-            QPushButton:checked {{
-                background-color: #333333;
-                border: 2px solid #39FF14;
-                color: #39FF14;
-            }}
-        """)
+        self.pin_btn.setObjectName("pinBtn")
         content_layout.addWidget(self.pin_btn)
 
         layout.addWidget(content)
         self.setLayout(layout)
-        self.setFixedSize(480, 600)
+        # One stylesheet for the whole window instead of a parse per widget
+        self.setStyleSheet(APP_SS)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -1154,44 +1581,52 @@ class DownloaderApp(QWidget):
 
     def set_platform_icon(self, platform: Platform):
         """Set icon based on platform using per-platform images or fallback emojis."""
+        # Nothing to do while the detected platform stays the same
+        if platform == self._last_platform:
+            return
+        self._last_platform = platform
+        # Resolved once per platform; cleared whenever icon settings are reloaded
+        icon = self._platform_icon_memo.get(platform)
+        if icon is None:
+            icon = self._resolve_platform_icon(platform)
+            self._platform_icon_memo[platform] = icon
+        pixmap, text, style = icon
+        self.play_icon.setPixmap(pixmap)
+        self.play_icon.setText(text)
+        self.play_icon.setStyleSheet(style)
+
+    def _resolve_platform_icon(self, platform: Platform):
+        """Return the (pixmap, text, stylesheet) shown for a platform."""
         if not self.dynamic_icons_enabled:
             # Use global icon if present
-            if self.global_icon_path and os.path.exists(self.global_icon_path):
-                self.load_custom_icon(self.global_icon_path)
-            else:
-                self.reset_to_default_icon()
-            return
+            scaled = self._scaled_icon(self._resolved_global_icon)
+            if scaled is not None:
+                return scaled, "", "background: transparent;"
+            return QPixmap(), "📺", "color: #FF0000; font-size: 20px; background: transparent;"
 
         # Try per-platform custom icon first
-        chosen_path = self.platform_icon_paths.get(platform, '')
-        if chosen_path and os.path.exists(chosen_path):
-            if self.load_custom_icon(chosen_path):
-                return
+        scaled = self._scaled_icon(self._resolved_platform_icons.get(platform))
+        if scaled is not None:
+            return scaled, "", "background: transparent;"
 
         # Fallback emojis/colors
-        self.play_icon.setPixmap(QPixmap())
-        if platform == Platform.YOUTUBE:
-            self.play_icon.setText("📺")
-            self.play_icon.setStyleSheet(f"color: {Config.YOUTUBE_RED}; font-size: 20px; background: transparent;")
-        elif platform == Platform.TIKTOK:
-            self.play_icon.setText("🎵")
-            self.play_icon.setStyleSheet("color: #FFFFFF; font-size: 20px; background: transparent;")
-        elif platform == Platform.TWITTER:
-            self.play_icon.setText("🐦")
-            self.play_icon.setStyleSheet("color: #1DA1F2; font-size: 20px; background: transparent;")
-        elif platform == Platform.IMAGE:
-            self.play_icon.setText("🖼️")
-            self.play_icon.setStyleSheet("color: #DDDDDD; font-size: 20px; background: transparent;")
-        else:
-            # Default: prefer YouTube icon if configured, otherwise TV emoji
-            yt_path = self.platform_icon_paths.get(Platform.YOUTUBE, '')
-            if yt_path and os.path.exists(yt_path) and self.load_custom_icon(yt_path):
-                return
-            self.play_icon.setText("📺")
-            self.play_icon.setStyleSheet("color: #FF0000; font-size: 20px; background: transparent;")
+        fallback = self._PLATFORM_FALLBACK.get(platform)
+        if fallback is not None:
+            return (QPixmap(),) + fallback
+
+        # Default: prefer YouTube icon if configured, otherwise TV emoji
+        scaled = self._scaled_icon(self._resolved_platform_icons.get(Platform.YOUTUBE))
+        if scaled is not None:
+            return scaled, "", "background: transparent;"
+        return (QPixmap(),) + self._PLATFORM_FALLBACK[Platform.YOUTUBE]
 
     def on_url_changed(self, text: str):
-        platform = detect_platform(text)
+        # Restart the debounce timer; the icon updates when it fires
+        self._url_debounce.start()
+
+    def _do_url_changed(self):
+        current_url = self.url_input.text().strip()
+        platform = detect_platform(current_url)
         self.set_platform_icon(platform)
 
     def load_gif_animation(self):
@@ -1205,47 +1640,64 @@ class DownloaderApp(QWidget):
                 return
         
         # Try default GIF locations if no custom GIF
+        gif_path = self.resolve_default_gif_path()
+        if gif_path and self.load_custom_gif(gif_path):
+            return
+        
+        # Fallback to emoji if no GIF is found
+        logging.info("GIF not found in any location, using emoji fallback")
+        self.reset_to_default_gif()
+
+    @classmethod
+    def resolve_default_gif_path(cls):
+        """Find the default GIF once per process, remembering it in settings for the next launch."""
+        if cls._resolved_gif_path is not None:
+            return cls._resolved_gif_path
+        
+        settings = load_settings()
+        remembered = settings.get('resolved_gif_path', '')
+        if remembered and os.path.exists(remembered):
+            cls._resolved_gif_path = remembered
+            return remembered
+        
         gif_paths = [
             Config.GIF_PATH,  # User's Downloads folder
             os.path.join(os.path.dirname(__file__), "giphy.gif"),  # Same folder as script
             os.path.join(os.path.dirname(__file__), "assets", "giphy.gif"),  # Assets folder
             "giphy.gif"  # Current directory
         ]
-        
-        gif_loaded = False
-        for gif_path in gif_paths:
-            try:
-                if os.path.exists(gif_path):
-                    self.gif_movie = QMovie(gif_path)
-                    if self.gif_movie.isValid():
-                        self.gif_movie.setScaledSize(self.gif_label.size())
-                        self.gif_label.setMovie(self.gif_movie)
-                        self.gif_movie.start()
-                        gif_loaded = True
-                        break
-            except Exception as e:
-                continue
-        
-        # Fallback to emoji if no GIF is found
-        if not gif_loaded:
-            logging.info("GIF not found in any location, using emoji fallback")
-            self.reset_to_default_gif()
+        found = next((os.path.abspath(p) for p in gif_paths if os.path.exists(p)), '')
+        cls._resolved_gif_path = found
+        if found and found != remembered:
+            settings['resolved_gif_path'] = found
+            save_settings(settings)
+        return found
 
     def load_custom_gif(self, gif_path):
         """Load a custom GIF and automatically resize it to fit the current size"""
         try:
             if os.path.exists(gif_path):
-                # Stop current movie if any
-                if hasattr(self, 'gif_movie') and self.gif_movie:
-                    self.gif_movie.stop()
+                movie = getattr(self, 'gif_movie', None)
                 
-                # Load new GIF
-                self.gif_movie = QMovie(gif_path)
-                if self.gif_movie.isValid():
-                    # Automatically scale to the current GIF label size (80x80)
-                    self.gif_movie.setScaledSize(self.gif_label.size())
-                    self.gif_label.setMovie(self.gif_movie)
-                    self.gif_movie.start()
+                # Same file already loaded: just make sure it is shown and playing
+                if movie and movie.fileName() == gif_path and movie.isValid():
+                    self.gif_label.setMovie(movie)
+                    movie.start()
+                    return True
+                
+                # Swap the file on the existing movie instead of building a new one
+                if movie:
+                    movie.stop()
+                else:
+                    # Cache mode must be set before a file is attached so every frame is decoded once
+                    movie = self.gif_movie = QMovie(self)
+                    movie.setCacheMode(QMovie.CacheAll)
+                movie.setFileName(gif_path)
+                if movie.isValid():
+                    # Scale before start() so frames are cached at the final (80x80) size
+                    movie.setScaledSize(self.gif_label.size())
+                    self.gif_label.setMovie(movie)
+                    movie.start()
                     return True
         except Exception as e:
             logging.error(f"Failed to load custom GIF: {e}")
@@ -1259,7 +1711,7 @@ class DownloaderApp(QWidget):
         # Reset to emoji fallback
         self.gif_label.setMovie(None)
         self.gif_label.setText("🎬")
-        self.gif_label.setStyleSheet(f"color: {Config.NEON_GREEN}; font-size: 32px; background: transparent;")
+        self.gif_label.setStyleSheet(GIF_FALLBACK_SS)
 
     def load_url_icon(self):
         """Load custom URL icon if available"""
@@ -1273,23 +1725,22 @@ class DownloaderApp(QWidget):
             self.load_custom_icon(self.global_icon_path)
         # If no custom icon, keep the default emoji that's already set
 
+    def _scaled_icon(self, icon_path):
+        """Return icon_path scaled to the play icon size, or None if it can't be loaded."""
+        if not icon_path:
+            return None
+        return _scaled_pixmap(icon_path, self.play_icon.size())
+
     def load_custom_icon(self, icon_path):
         """Load a custom icon and automatically resize it to fit the current size"""
         try:
-            if os.path.exists(icon_path):
-                # Load and scale the image to fit the icon size (32x32)
-                pixmap = QPixmap(icon_path)
-                if not pixmap.isNull():
-                    # Scale to fit while maintaining aspect ratio
-                    scaled_pixmap = pixmap.scaled(
-                        self.play_icon.size(), 
-                        Qt.KeepAspectRatio, 
-                        Qt.SmoothTransformation
-                    )
-                    self.play_icon.setPixmap(scaled_pixmap)
-                    self.play_icon.setText("")  # Clear the emoji text
-                    self.play_icon.setStyleSheet("background: transparent;")
-                    return True
+            scaled_pixmap = self._scaled_icon(icon_path)
+            if scaled_pixmap is not None:
+                self.play_icon.setPixmap(scaled_pixmap)
+                self.play_icon.setText("")  # Clear the emoji text
+                self.play_icon.setStyleSheet("background: transparent;")
+                self._last_platform = None  # Label no longer shows a platform icon
+                return True
         except Exception as e:
             logging.error(f"Failed to load custom icon: {e}")
         return False
@@ -1299,6 +1750,7 @@ class DownloaderApp(QWidget):
         self.play_icon.setPixmap(QPixmap())  # Clear any custom pixmap
         self.play_icon.setText("📺")
         self.play_icon.setStyleSheet("color: #FF0000; font-size: 20px; background: transparent;")
+        self._last_platform = None
         # Do not clear per-platform icons; only global
         self.global_icon_path = ''
 
@@ -1311,13 +1763,29 @@ class DownloaderApp(QWidget):
             Platform.TIKTOK: s.get('tiktok_icon_path', ''),
             Platform.TWITTER: s.get('twitter_icon_path', '')
         }
+        # Probe the configured icon files once here rather than on every URL change
+        self._resolved_global_icon = self.global_icon_path if self.global_icon_path and os.path.exists(self.global_icon_path) else None
+        self._resolved_platform_icons = {
+            p: (path if path and os.path.exists(path) else None)
+            for p, path in self.platform_icon_paths.items()
+        }
+        self._platform_icon_memo = {}
+        self._last_platform = None
 
-    def refresh_dynamic_icon(self):
-        current_url = self.url_input.text().strip()
-        platform = detect_platform(current_url)
-        self.set_platform_icon(platform)
-
-    def apply_oled_black_theme(self):
+    def refresh_all(self, reset=False):
+        """Re-read icon settings and repaint the URL icon once, e.g. after the settings dialog changes them."""
+        if reset:
+            self.reset_to_default_icon()
+        self.reload_icon_settings()
+        # Repaint now; a pending debounced update would only repeat the work
+        self._url_debounce.stop()
+        self._do_url_changed()
+
+    @classmethod
+    def _build_palettes(cls):
+        """Build the dark and light palettes once; later instances and theme toggles reuse them."""
+        if cls._PALETTE_DARK is not None:
+            return
         oled_dark_gray = "#000000"
 
         palette = QPalette()
@@ -1330,15 +1798,8 @@ class DownloaderApp(QWidget):
         palette.setColor(QPalette.ButtonText, QColor("#DDDDDD"))
         palette.setColor(QPalette.Highlight, QColor("#444444"))
         palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
-        self.setPalette(palette)
+        cls._PALETTE_DARK = palette
 
-    def toggle_theme(self):
-        if self.palette().color(QPalette.Window) == QColor("#000000"):
-            self.apply_light_theme()
-        else:
-            self.apply_oled_black_theme()
-
-    def apply_light_theme(self):
         palette = QPalette()
         palette.setColor(QPalette.Window, QColor("#FFFFFF"))
         palette.setColor(QPalette.WindowText, QColor("#222222"))
@@ -1349,7 +1810,19 @@ class DownloaderApp(QWidget):
         palette.setColor(QPalette.ButtonText, QColor("#222222"))
         palette.setColor(QPalette.Highlight, QColor("#0078D7"))
         palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
-        self.setPalette(palette)
+        cls._PALETTE_LIGHT = palette
+
+    def apply_oled_black_theme(self):
+        self.setPalette(self._PALETTE_DARK)
+
+    def toggle_theme(self):
+        if self.palette().color(QPalette.Window) == self._PALETTE_DARK.color(QPalette.Window):
+            self.apply_light_theme()
+        else:
+            self.apply_oled_black_theme()
+
+    def apply_light_theme(self):
+        self.setPalette(self._PALETTE_LIGHT)
 
     def validate_url(self, url):
         """Validate and clean the URL"""
@@ -1357,18 +1830,14 @@ class DownloaderApp(QWidget):
             return False, "Please enter a URL."
         
         # Basic URL validation
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                # Handle relative URLs - might be incomplete Twitter image URLs
-                if url.startswith('/') and ('format=jpg' in url or 'format=png' in url or 'format=webp' in url):
-                    return False, "Incomplete Twitter image URL. Please copy the full URL starting with https://pbs.twimg.com"
-                return False, "Invalid URL format."
-        except Exception:
+        if not _URL_SCHEME_RE.match(url):
+            # Handle relative URLs - might be incomplete Twitter image URLs
+            if url.startswith('/') and any(fmt in url for fmt in _TWIMG_FORMATS):
+                return False, "Incomplete Twitter image URL. Please copy the full URL starting with https://pbs.twimg.com"
             return False, "Invalid URL format."
         
         # Check for supported URLs
-        if not (is_video_url(url) or is_image_url(url) or is_twitter_media_url(url)):
+        if classify_url(url) is Platform.UNKNOWN:
             return False, "Supported: YouTube videos, Twitter/X posts, or direct image URLs (jpg, png, gif, etc.)"
         
         return True, "URL is valid."
@@ -1378,34 +1847,44 @@ class DownloaderApp(QWidget):
         quality = self.quality_combo.currentText()
         download_subtitles = self.subtitle_checkbox.isChecked()
         
-        # Validate URL
-        is_valid, message = self.validate_url(url)
-        if not is_valid:
-            QMessageBox.critical(self, "⚠️ Input Error", message)
-            return
-        
-        # Check if it's an image URL and show appropriate message
-        if is_image_url(url):
-            self.status_label.setText("📸 Downloading image...")
-        elif is_twitter_media_url(url):
-            self.status_label.setText("🐦 Downloading Twitter media...")
+        # Several whitespace-separated URLs are downloaded as one image batch
+        urls = url.split()
+        if len(urls) > 1:
+            for item in urls:
+                is_valid, message = self.validate_url(item)
+                if not is_valid:
+                    QMessageBox.critical(self, "⚠️ Input Error", f"{message}\n\n{item}")
+                    return
+                if not is_image_url(item):
+                    QMessageBox.critical(self, "⚠️ Input Error", "Multiple URLs are only supported for direct image links.")
+                    return
+            url = urls
+            self.status_label.setText(f"📸 Downloading {len(urls)} images...")
         else:
-            self.status_label.setText("📥 Downloading video...")
+            # Validate URL
+            is_valid, message = self.validate_url(url)
+            if not is_valid:
+                QMessageBox.critical(self, "⚠️ Input Error", message)
+                return
+            
+            # Check if it's an image URL and show appropriate message
+            platform = classify_url(url)
+            if platform is Platform.IMAGE:
+                self.status_label.setText("📸 Downloading image...")
+            elif platform is Platform.TWITTER:
+                self.status_label.setText("🐦 Downloading Twitter media...")
+            else:
+                self.status_label.setText("📥 Downloading video...")
             
         self.download_btn.setEnabled(False)
         self.progress_bar.setValue(0)
-        self.status_label.setStyleSheet(f"color: {Config.LIGHT_GRAY}; background-color: {Config.OLED_BLACK}; border-radius:6px;")
+        self.status_label.setStyleSheet(STATUS_BUSY_SS)
         
         worker = DownloadWorker(url, quality, download_subtitles)
-        self.workers.append(worker)
-        worker.finished.connect(lambda success, msg, w=worker: self.on_worker_finished(success, msg, w))
-        worker.progress.connect(self.progress_bar.setValue)
-        worker.update_speed.connect(self.speed_label.setText)
-        worker.start()
-
-    def on_worker_finished(self, success, message, worker):
-        self.workers.remove(worker)
-        self.download_finished(success, message)
+        worker.signals.finished.connect(self.download_finished)
+        worker.signals.progress.connect(self.progress_bar.setValue)
+        worker.signals.update_speed.connect(self.speed_label.setText)
+        QThreadPool.globalInstance().start(worker)
 
     def download_finished(self, success, message):
         self.download_btn.setEnabled(True)
@@ -1434,21 +1913,31 @@ class DownloaderApp(QWidget):
             if event.type() == QEvent.Drop:
                 if event.mimeData().hasUrls():
                     url = event.mimeData().urls()[0].toString()
-                    self.url_input.setText(url)
+                    self._set_dropped_url(url)
                     return True
                 elif event.mimeData().hasText():
-                    self.url_input.setText(event.mimeData().text())
+                    self._set_dropped_url(event.mimeData().text())
                     return True
         return super().eventFilter(source, event)
 
+    def _set_dropped_url(self, text):
+        """Fill the URL box from a drop and update the icon after the drop event returns."""
+        self.url_input.blockSignals(True)
+        self.url_input.setText(text)
+        self.url_input.blockSignals(False)
+        QTimer.singleShot(0, self._do_url_changed)
+
     # Open download folder in Explorer
     def open_download_folder(self):
-        subprocess.Popen(f'explorer "{OUTPUT_DIR}"')
+        # Detached so Explorer is not a child the GUI thread has to reap
+        QProcess.startDetached('explorer', [OUTPUT_DIR])
 
     def closeEvent(self, event):
         event.ignore()
         self.hide()
-        self.tray_icon.showMessage("Downloader", "App minimized to tray.", QSystemTrayIcon.Information, 2000)
+        if not self._tray_notified:
+            self.tray_icon.showMessage("Downloader", "App minimized to tray.", QSystemTrayIcon.Information, 2000)
+            self._tray_notified = True
 
     def open_settings(self):
         dlg = SettingsDialog(self)
@@ -1465,6 +1954,7 @@ class DownloaderApp(QWidget):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)  
+    QPixmapCache.setCacheLimit(10240)  # KB; scaled icons are shared through this cache
     window = DownloaderApp()
     window.show()
     sys.exit(app.exec_())